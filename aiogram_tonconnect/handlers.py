@@ -1,206 +1,260 @@
-from contextlib import suppress
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
 
-from aiogram import Dispatcher, Router, F
-from aiogram.enums import ChatType
+from aiogram import Dispatcher, Router
 from aiogram.types import CallbackQuery
 from tonutils.tonconnect.utils.exceptions import WalletNotConnectedError
 
 from .manager import ATCManager
+from .tonconnect.tasks import create_background_task
+from .tonconnect.wallets import get_wallet
+from .utils.qrcode.generator import close_session
 from .utils.states import TcState
 
+Action = Callable[[ATCManager, str], Awaitable[None]]
 
-class AiogramTonConnectHandlers:
 
-    @staticmethod
-    async def connect_wallet_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to connecting a wallet.
+async def _reset_connect_wallet(atc_manager: ATCManager) -> None:
+    """
+    Cancel the waiting task and disconnect the wallet before handling the connect wallet window.
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
-        atc_manager.task_storage.remove()
-
-        if atc_manager.connector.connected:
-            with suppress(WalletNotConnectedError):
-                await atc_manager.connector.disconnect_wallet()
-
-        if call.data and call.data.startswith("app_wallet:"):
-            wallets = await atc_manager.tonconnect.get_wallets()
-            app_wallet_name = call.data.split(":")[1]
-            app_wallet = next((w for w in wallets if w.app_name == app_wallet_name), wallets[0])
-            await atc_manager.state.update_data(app_wallet=app_wallet.to_dict())
-            await atc_manager.retry_connect_wallet()
-
-        elif call.data == "back":
-            atc_manager.connector.cancel_connection_request()
-            await atc_manager.connector.bridge.close()
-            await atc_manager.execute_connect_wallet_before_callback()
-
-        await call.answer()
-
-    @staticmethod
-    async def connect_wallet_proof_wrong_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to wrong proof during wallet connection.
+    :param atc_manager: An instance of ATCManager.
+    """
+    atc_manager.task_storage.remove()
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
+    connector = atc_manager.connector
+    if connector.connected:
+        try:
+            await connector.disconnect_wallet()
+        except WalletNotConnectedError:
+            pass
 
-        if call.data == "retry":
-            await atc_manager.retry_connect_wallet()
-        elif call.data == "back":
-            await atc_manager.execute_connect_wallet_before_callback()
 
-        await call.answer()
+async def _select_app_wallet(atc_manager: ATCManager, app_wallet_name: str) -> None:
+    """
+    Select the app wallet and reopen the connect wallet window.
+
+    Selecting the already selected wallet while its connection is still awaited keeps the current window,
+    so repeated taps do not restart the connection request.
 
-    @staticmethod
-    async def connect_wallet_timeout_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to connection timeout during wallet connection.
+    :param atc_manager: An instance of ATCManager.
+    :param app_wallet_name: App name of the selected wallet.
+    """
+    state_data = await atc_manager.get_state_data()
+    selected_app_wallet = state_data.get("app_wallet")
+    task = atc_manager.task_storage.get()
+    if (
+            selected_app_wallet is not None and
+            selected_app_wallet.get("app_name") == app_wallet_name and
+            task is not None and not task.done()
+    ):
+        return
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
+    await _reset_connect_wallet(atc_manager)
+    app_wallet = await get_wallet(atc_manager.tonconnect, app_wallet_name)
+    await atc_manager.update_state_data(app_wallet=app_wallet.to_dict())
+    await atc_manager.retry_connect_wallet()
 
-        if call.data == "retry":
-            await atc_manager.retry_connect_wallet()
-        elif call.data == "back":
-            await atc_manager.execute_connect_wallet_before_callback()
 
-        await call.answer()
+async def _cancel_connect_wallet(atc_manager: ATCManager, _: str) -> None:
+    """
+    Cancel the pending connection request and go back.
 
-    @staticmethod
-    async def connect_wallet_rejected_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to wallet connection rejection.
+    :param atc_manager: An instance of ATCManager.
+    """
+    await _reset_connect_wallet(atc_manager)
+    connector = atc_manager.connector
+    connector.cancel_connection_request()
+    # The bridge being closed is bound before the callback runs, so a new bridge
+    # opened by the callback is not affected
+    await asyncio.gather(
+        connector.bridge.close(),
+        atc_manager.execute_connect_wallet_before_callback(),
+    )
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
 
-        if call.data == "retry":
-            await atc_manager.retry_connect_wallet()
-        elif call.data == "back":
-            await atc_manager.execute_connect_wallet_before_callback()
+async def _retry_connect_wallet(atc_manager: ATCManager, _: str) -> None:
+    """
+    Reopen the connect wallet window.
 
-        await call.answer()
+    :param atc_manager: An instance of ATCManager.
+    """
+    await atc_manager.retry_connect_wallet()
 
-    @staticmethod
-    async def send_transaction_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to sending a transaction.
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
+async def _back_connect_wallet(atc_manager: ATCManager, _: str) -> None:
+    """
+    Go back from the connect wallet window.
 
-        atc_manager.task_storage.remove()
+    :param atc_manager: An instance of ATCManager.
+    """
+    await atc_manager.execute_connect_wallet_before_callback()
 
-        if call.data == "back":
-            state_data = await atc_manager.state.get_data()
-            last_rpc_request_id = state_data.get("last_rpc_request_id", 0)
-            atc_manager.connector.cancel_pending_transaction(last_rpc_request_id)
-            await atc_manager.execute_transaction_before_callback()
 
-        await call.answer()
+async def _cancel_send_transaction(atc_manager: ATCManager, _: str) -> None:
+    """
+    Cancel the pending transaction and go back.
 
-    @staticmethod
-    async def send_transaction_timeout_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to transaction timeout during sending.
+    :param atc_manager: An instance of ATCManager.
+    """
+    atc_manager.cancel_last_send_transaction()
+    await atc_manager.execute_transaction_before_callback()
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
 
-        if call.data == "retry":
-            await atc_manager.retry_last_send_transaction()
-        elif call.data == "back":
-            await atc_manager.execute_transaction_before_callback()
+async def _retry_send_transaction(atc_manager: ATCManager, _: str) -> None:
+    """
+    Send the last transaction again.
 
-        await call.answer()
+    :param atc_manager: An instance of ATCManager.
+    """
+    await atc_manager.retry_last_send_transaction()
 
-    @staticmethod
-    async def send_transaction_rejected_callback_query_handler(
-            call: CallbackQuery,
-            atc_manager: ATCManager,
-    ) -> None:
-        """
-        Handle callback queries related to rejected transactions.
 
-        :param call: The CallbackQuery instance.
-        :param atc_manager: An instance of ATCManager.
-        """
-        await atc_manager.tonconnect.init_connector(atc_manager.user.id)
+async def _back_send_transaction(atc_manager: ATCManager, _: str) -> None:
+    """
+    Go back from the send transaction window.
+
+    :param atc_manager: An instance of ATCManager.
+    """
+    await atc_manager.execute_transaction_before_callback()
+
+
+# Mapping of callback data actions to their handlers for each window
+CONNECT_WALLET_ACTIONS: Dict[str, Action] = {
+    "app_wallet": _select_app_wallet,
+    "back": _cancel_connect_wallet,
+}
+RETRY_CONNECT_WALLET_ACTIONS: Dict[str, Action] = {
+    "retry": _retry_connect_wallet,
+    "back": _back_connect_wallet,
+}
+SEND_TRANSACTION_ACTIONS: Dict[str, Action] = {
+    "back": _cancel_send_transaction,
+}
+RETRY_SEND_TRANSACTION_ACTIONS: Dict[str, Action] = {
+    "retry": _retry_send_transaction,
+    "back": _back_send_transaction,
+}
+
+
+def _is_private_chat(call: CallbackQuery) -> bool:
+    """
+    Check if the callback query comes from a message in a private chat.
 
-        if call.data == "retry":
-            await atc_manager.retry_last_send_transaction()
-        elif call.data == "back":
-            await atc_manager.execute_transaction_before_callback()
+    :param call: The CallbackQuery instance.
+    :return: True if the message chat is private, False otherwise.
+    """
+    return call.message is not None and call.message.chat.type == "private"
 
-        await call.answer()
+
+async def _reset_send_transaction(atc_manager: ATCManager) -> None:
+    """
+    Cancel the waiting task before handling the send transaction window.
+
+    :param atc_manager: An instance of ATCManager.
+    """
+    atc_manager.task_storage.remove()
+
+
+def _create_handler(
+        actions: Dict[str, Action],
+        prepare: Optional[Callable[[ATCManager], Awaitable[None]]] = None,
+) -> Callable[[CallbackQuery, ATCManager], Awaitable[None]]:
+    """
+    Create a callback query handler for a window.
+
+    The handler answers the callback query in the background, initializes the connector,
+    runs the optional preparation and dispatches the action parsed from the callback data.
+    Callback data has the form "action" or "action:argument".
+
+    :param actions: Mapping of actions to their handlers.
+    :param prepare: Optional coroutine function executed before the action.
+    :return: The callback query handler.
+    """
+
+    async def handler(call: CallbackQuery, atc_manager: ATCManager) -> None:
+        create_background_task(call.answer())
+
+        await atc_manager.init_connector()
+        if prepare is not None:
+            await prepare(atc_manager)
+
+        action, _, argument = (call.data or "").partition(":")
+        action_handler = actions.get(action)
+        if action_handler is not None:
+            await action_handler(atc_manager, argument)
+
+    return handler
+
+
+# Handlers shared by the windows offering the same "retry" and "back" actions
+_retry_connect_wallet_handler = _create_handler(RETRY_CONNECT_WALLET_ACTIONS)
+_retry_send_transaction_handler = _create_handler(RETRY_SEND_TRANSACTION_ACTIONS)
+
+
+class AiogramTonConnectHandlers:
+    """
+    Callback query handlers for the AiogramTonConnect windows.
+
+    :param max_concurrency: Maximum number of callback queries handled at the same time.
+        Extra callback queries wait for a free slot, which bounds the concurrent Bot API and bridge work
+        under bursts of updates.
+    """
+
+    # Default for subclasses that do not call the base __init__
+    max_concurrency: int = 256
+
+    def __init__(self, max_concurrency: int = 256) -> None:
+        self.max_concurrency = max_concurrency
+
+    # Handle callback queries related to connecting a wallet.
+    connect_wallet_callback_query_handler = staticmethod(_create_handler(CONNECT_WALLET_ACTIONS))
+    # Handle callback queries related to wrong proof during wallet connection.
+    connect_wallet_proof_wrong_callback_query_handler = staticmethod(_retry_connect_wallet_handler)
+    # Handle callback queries related to connection timeout during wallet connection.
+    connect_wallet_timeout_callback_query_handler = staticmethod(_retry_connect_wallet_handler)
+    # Handle callback queries related to wallet connection rejection.
+    connect_wallet_rejected_callback_query_handler = staticmethod(_retry_connect_wallet_handler)
+    # Handle callback queries related to sending a transaction.
+    send_transaction_callback_query_handler = staticmethod(
+        _create_handler(SEND_TRANSACTION_ACTIONS, _reset_send_transaction)
+    )
+    # Handle callback queries related to transaction timeout during sending.
+    send_transaction_timeout_callback_query_handler = staticmethod(_retry_send_transaction_handler)
+    # Handle callback queries related to rejected transactions.
+    send_transaction_rejected_callback_query_handler = staticmethod(_retry_send_transaction_handler)
 
     def register(self, dp: Dispatcher):
         """
         Register AiogramTonConnect-related handlers with the given Dispatcher.
 
+        The handlers are resolved by the raw FSM state once, so each callback query
+        is routed with a single dictionary lookup instead of checking every state filter.
+        The HTTP session shared by QR code image downloads is closed on the dispatcher shutdown.
+
         :param dp: The Dispatcher instance.
         """
+        handlers: Dict[str, Callable[[CallbackQuery, ATCManager], Awaitable[None]]] = {
+            TcState.connect_wallet.state: self.connect_wallet_callback_query_handler,
+            TcState.connect_wallet_proof_wrong.state: self.connect_wallet_proof_wrong_callback_query_handler,
+            TcState.connect_wallet_timeout.state: self.connect_wallet_timeout_callback_query_handler,
+            TcState.connect_wallet_rejected.state: self.connect_wallet_rejected_callback_query_handler,
+            TcState.send_transaction.state: self.send_transaction_callback_query_handler,
+            TcState.send_transaction_timeout.state: self.send_transaction_timeout_callback_query_handler,
+            TcState.send_transaction_rejected.state: self.send_transaction_rejected_callback_query_handler,
+        }
+
+        def state_filter(_: CallbackQuery, raw_state: Optional[str] = None) -> bool:
+            return raw_state in handlers
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def callback_query_handler(call: CallbackQuery, atc_manager: ATCManager, raw_state: str) -> None:
+            async with semaphore:
+                await handlers[raw_state](call, atc_manager)
+
         router = Router()
-        router.callback_query.filter(F.message.chat.type == ChatType.PRIVATE)
-
-        router.callback_query.register(
-            self.connect_wallet_callback_query_handler,
-            TcState.connect_wallet,
-        )
-        router.callback_query.register(
-            self.connect_wallet_proof_wrong_callback_query_handler,
-            TcState.connect_wallet_proof_wrong,
-        )
-        router.callback_query.register(
-            self.connect_wallet_timeout_callback_query_handler,
-            TcState.connect_wallet_timeout,
-        )
-        router.callback_query.register(
-            self.connect_wallet_timeout_callback_query_handler,
-            TcState.connect_wallet_rejected,
-        )
-        router.callback_query.register(
-            self.send_transaction_callback_query_handler,
-            TcState.send_transaction,
-        )
-        router.callback_query.register(
-            self.send_transaction_timeout_callback_query_handler,
-            TcState.send_transaction_timeout,
-        )
-        router.callback_query.register(
-            self.send_transaction_rejected_callback_query_handler,
-            TcState.send_transaction_rejected,
-        )
+        router.callback_query.filter(_is_private_chat)
+        router.callback_query.register(callback_query_handler, state_filter)
         dp.include_router(router)
+        dp.shutdown.register(close_session)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import random
 import time
+import weakref
 from contextlib import suppress
-from typing import Dict, Any, Union, Optional, Callable
+from typing import Dict, Any, Union, Optional, Callable, FrozenSet, Tuple, Awaitable, TypeVar
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import (
     BufferedInputFile,
@@ -15,6 +18,7 @@ from aiogram.types import (
     Message,
 )
 from aiogram.utils.markdown import hide_link
+from cachetools import TTLCache
 from tonutils.tonconnect import (
     TonConnect,
     Connector,
@@ -39,13 +43,15 @@ from .tonconnect.models import (
     ATCUser,
     ConnectWalletCallbacks,
     SendTransactionCallbacks, InfoWallet, AccountWallet, )
-from .tonconnect.tasks import TaskStorage
+from .tonconnect.tasks import TaskStorage, create_background_task
+from .tonconnect.wallets import get_direct_url, get_wallets
 from .utils.exceptions import (
     LanguageCodeNotSupported,
     RetryConnectWalletError,
     RetrySendTransactionError,
-    MESSAGE_DELETE_ERRORS,
-    MESSAGE_EDIT_ERRORS,
+    MESSAGE_DELETE_ERRORS_RE,
+    MESSAGE_DELETE_NOT_FOUND_ERROR,
+    MESSAGE_EDIT_ERRORS_RE,
 )
 from .utils.keyboards import InlineKeyboardBase
 from .utils.qrcode import (
@@ -55,6 +61,61 @@ from .utils.qrcode import (
 from .utils.states import TcState
 from .utils.texts import TextMessageBase
 
+# Initialize cache for storing users without a wallet whose connection was restored within the last minute
+RESTORED_CONNECTORS: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Locks serializing message updates of each user, released together with the last waiter
+MESSAGE_LOCKS: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+# The latest pending message update of each user
+PENDING_MESSAGES: Dict[int, object] = {}
+# Languages supported by both the text message and the inline keyboard classes
+SUPPORTED_LANGUAGES: Dict[Tuple[type, type], FrozenSet[str]] = {}
+
+# Parameter names of callbacks, released together with the callbacks
+PARAMETERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Maximum number of retries of a Bot API request hitting the flood limit
+RETRY_AFTER_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+
+async def _retry_after(method: Callable[..., Awaitable[T]], **kwargs: Any) -> T:
+    """
+    Call a Bot API method, waiting and retrying when Telegram reports a flood limit.
+
+    :param method: The Bot API method to call.
+    :param kwargs: Arguments of the method.
+    :return: The result of the method.
+    :raises TelegramRetryAfter: If the flood limit is still reported after all retries.
+    """
+    for _ in range(RETRY_AFTER_ATTEMPTS):
+        try:
+            return await method(**kwargs)
+        except TelegramRetryAfter as ex:
+            # Jitter spreads out the retries of requests that hit the limit together
+            await asyncio.sleep(ex.retry_after + random.uniform(0, 1))
+    return await method(**kwargs)
+
+
+def _get_parameters(func: Callable) -> Tuple[str, ...]:
+    """
+    Get the parameter names of a function.
+
+    Callbacks are the same few functions for every update, so their signatures are inspected once.
+    Callables that cannot be weakly referenced or hashed are inspected on every call.
+
+    :param func: The function.
+    :return: Tuple of parameter names.
+    """
+    try:
+        parameters = PARAMETERS.get(func)
+    except TypeError:
+        return tuple(inspect.signature(func).parameters)
+    if parameters is None:
+        parameters = PARAMETERS[func] = tuple(inspect.signature(func).parameters)
+    return parameters
+
 
 class ATCManager:
     """
@@ -90,15 +151,45 @@ class ATCManager:
         self.bot: Bot = data.get("bot")  # type: ignore
         self.state: FSMContext = data.get("state")  # type: ignore
 
-        self.connect_wallet_callbacks = ConnectWalletCallbackStorage(
-            storage=tonconnect.storage,
-            user_id=user.id,
-        )
-        self.send_transaction_callbacks = SendTransactionCallbackStorage(
-            storage=tonconnect.storage,
-            user_id=user.id,
-        )
-        self.task_storage = TaskStorage(user_id=user.id)
+        # Storages are created on first use, as most updates do not touch them
+        self._connect_wallet_callbacks: Optional[ConnectWalletCallbackStorage] = None
+        self._send_transaction_callbacks: Optional[SendTransactionCallbackStorage] = None
+        self._task_storage: Optional[TaskStorage] = None
+        self._state_data: Optional[Dict[str, Any]] = None
+        self._staged_state_data: Optional[Dict[str, Any]] = None
+
+    @property
+    def connect_wallet_callbacks(self) -> ConnectWalletCallbackStorage:
+        """
+        Get the storage of the connect wallet callbacks.
+        """
+        if self._connect_wallet_callbacks is None:
+            self._connect_wallet_callbacks = ConnectWalletCallbackStorage(
+                storage=self.tonconnect.storage,
+                user_id=self.user.id,
+            )
+        return self._connect_wallet_callbacks
+
+    @property
+    def send_transaction_callbacks(self) -> SendTransactionCallbackStorage:
+        """
+        Get the storage of the send transaction callbacks.
+        """
+        if self._send_transaction_callbacks is None:
+            self._send_transaction_callbacks = SendTransactionCallbackStorage(
+                storage=self.tonconnect.storage,
+                user_id=self.user.id,
+            )
+        return self._send_transaction_callbacks
+
+    @property
+    def task_storage(self) -> TaskStorage:
+        """
+        Get the storage of the user's waiting task.
+        """
+        if self._task_storage is None:
+            self._task_storage = TaskStorage(user_id=self.user.id)
+        return self._task_storage
 
     @property
     def middleware_data(self) -> Dict[str, Any]:
@@ -107,21 +198,107 @@ class ATCManager:
         """
         return self.__data
 
-    async def __get_filtered_kwargs(self, func: Callable) -> Dict[str, Any]:
-        params = inspect.signature(func).parameters
-        return {k: v for k, v in self.middleware_data.items() if k in params}
+    async def get_state_data(self) -> Dict[str, Any]:
+        """
+        Get the FSM state data.
+
+        The data is read from the storage once and cached for the lifetime of the manager.
+        The cache is invalidated after user callbacks, which may update the state on their own.
+
+        :return: The FSM state data.
+        """
+        if self._state_data is None:
+            self._state_data = await self.state.get_data()
+        return self._state_data
+
+    async def update_state_data(self, **kwargs: Any) -> None:
+        """
+        Update the FSM state data and the cached copy of it.
+
+        Data staged with _stage_state_data is written together with the given data.
+
+        :param kwargs: Data to update.
+        """
+        if self._staged_state_data is not None:
+            kwargs = {**self._staged_state_data, **kwargs}
+            self._staged_state_data = None
+        if self._state_data is not None:
+            self._state_data.update(kwargs)
+        await self.state.update_data(**kwargs)
+
+    def _stage_state_data(self, **kwargs: Any) -> None:
+        """
+        Stage FSM state data to be written with the next state data update.
+
+        :param kwargs: Data to stage.
+        """
+        if self._staged_state_data is None:
+            self._staged_state_data = {}
+        self._staged_state_data.update(kwargs)
+
+    async def _flush_state_data(self) -> None:
+        """
+        Write the staged FSM state data, if it was not written yet.
+        """
+        if self._staged_state_data is not None:
+            await self.update_state_data()
+
+    async def init_connector(self) -> Connector:
+        """
+        Initialize the user's connector and restore its connection if needed.
+
+        A connector with a live wallet session is returned as is. For a user without a wallet,
+        the connection restore is attempted at most once per minute.
+
+        :return: The initialized connector.
+        """
+        connector = self.connector
+        if connector.wallet is None:
+            if self.user.id in RESTORED_CONNECTORS:
+                return connector
+        elif connector.bridge is not None and not connector.bridge.client_session_closed:
+            return connector
 
-    async def __execute_callback(self, storage, callback_type: str) -> None:
+        self.connector = await self.tonconnect.init_connector(self.user.id)
+        if self.connector.wallet is None:
+            RESTORED_CONNECTORS[self.user.id] = None
+        return self.connector
+
+    def __get_filtered_kwargs(self, func: Callable) -> Dict[str, Any]:
+        params = _get_parameters(getattr(func, "__func__", func))
+        if not params:
+            return {}
+        data = self.__data
+        # Callbacks declare a few parameters, while the middleware data holds many keys
+        return {k: data[k] for k in params if k in data}
+
+    async def __execute_callback(
+            self,
+            storage,
+            callback_type: str,
+            callbacks: Optional[Union[ConnectWalletCallbacks, SendTransactionCallbacks]] = None,
+    ) -> None:
         """
         Generic method to execute a callback of the given type.
 
         :param storage: The storage containing the callback functions.
         :param callback_type: The type of callback to execute ('before_callback' or 'after_callback').
+        :param callbacks: Callbacks already loaded from the storage, if any.
         """
-        callbacks = await storage.get()
+        if callbacks is None:
+            callbacks = await storage.get()
         callback = getattr(callbacks, callback_type)
-        filtered_kwargs = await self.__get_filtered_kwargs(callback)
-        await callback(**filtered_kwargs)
+        filtered_kwargs = self.__get_filtered_kwargs(callback)
+
+        # The callback may change the message, so the next window must not be skipped as unchanged
+        state_data = await self.get_state_data()
+        if state_data.get("message_signature") is not None:
+            await self.update_state_data(message_signature=None)
+
+        try:
+            await callback(**filtered_kwargs)
+        finally:
+            self._state_data = None
 
     async def execute_connect_wallet_after_callback(self) -> None:
         await self.__execute_callback(self.connect_wallet_callbacks, "after_callback")
@@ -135,6 +312,23 @@ class ATCManager:
     async def execute_transaction_before_callback(self) -> None:
         await self.__execute_callback(self.send_transaction_callbacks, "before_callback")
 
+    def __get_supported_languages(self) -> FrozenSet[str]:
+        """
+        Get the languages supported by both the text message and the inline keyboard.
+
+        The texts are defined by the classes, so the result is computed once per pair of classes.
+
+        :return: Set of supported language codes.
+        """
+        key = type(self.__text_message), type(self.__inline_keyboard)
+        languages = SUPPORTED_LANGUAGES.get(key)
+        if languages is None:
+            languages = SUPPORTED_LANGUAGES[key] = (
+                    frozenset(self.__text_message.texts_messages) &
+                    frozenset(self.__inline_keyboard.texts_buttons)
+            )
+        return languages
+
     async def update_interfaces_language(self, language_code: str) -> None:
         """
         Update interfaces language.
@@ -142,13 +336,12 @@ class ATCManager:
         :param language_code: The language code to update to.
         :raise LanguageCodeNotSupported: If the provided language code is not supported.
         """
-        if (
-                language_code in self.__text_message.texts_messages and
-                language_code in self.__inline_keyboard.texts_buttons
-        ):
-            await self.state.update_data(language_code=language_code)
+        if language_code in self.__get_supported_languages():
+            await self.update_state_data(language_code=language_code)
             self.user.language_code = language_code
-            self.__text_message.language_code = self.__inline_keyboard.language_code = language_code
+            # The instances are shared between users, so new ones are bound instead of mutating them
+            self.__text_message = type(self.__text_message)(language_code)
+            self.__inline_keyboard = type(self.__inline_keyboard)(language_code)
             return None
 
         raise LanguageCodeNotSupported(
@@ -172,40 +365,50 @@ class ATCManager:
         Link to the specification:
             https://github.com/ton-blockchain/ton-connect/blob/main/requests-responses.md#initiating-connection
         """
-        await self.disconnect_wallet()
+        # The state data is read before the loader is sent, so the loader updates the cached data in place
+        state_data = await self.get_state_data()
 
+        loader_task = None
         if isinstance(self.__qrcode_provider, QRImageProviderBase):
             text = self.__text_message.get("loader_text")
-            await self._send_message(text)
-
-        await self.connect_wallet_callbacks.add(callbacks)
+            loader_task = asyncio.create_task(self._send_message(text))
 
-        state_data = await self.state.get_data()
-        wallets = await self.tonconnect.get_wallets()
+        try:
+            # The previous wallet is disconnected before the connector opens a new connection
+            wallets, _, _ = await asyncio.gather(
+                get_wallets(self.tonconnect),
+                self.connect_wallet_callbacks.add(callbacks),
+                self.disconnect_wallet(),
+            )
 
-        app_wallet_dict = state_data.get("app_wallet") or wallets[0].to_dict()
-        app_wallet = WalletApp.from_dict(app_wallet_dict)
+            app_wallet_dict = state_data.get("app_wallet") or wallets[0].to_dict()
+            app_wallet = WalletApp.from_dict(app_wallet_dict)
 
-        ton_proof = proof_payload or generate_proof_payload()
-        universal_url = await self.connector.connect_wallet(app_wallet, ton_proof=ton_proof)
+            ton_proof = proof_payload or generate_proof_payload()
+            universal_url = await self.connector.connect_wallet(app_wallet, ton_proof=ton_proof)
+        finally:
+            # The loader must be stored before the state is written again
+            if loader_task is not None:
+                await loader_task
 
-        await self.state.update_data(
-            app_wallet=app_wallet.to_dict(),
+        # Written together with the message ID of the window
+        self._stage_state_data(
+            app_wallet=app_wallet_dict,
             proof_payload=proof_payload,
         )
 
-        task = asyncio.create_task(self.__wait_connect_wallet_task())
+        task = create_background_task(self.__wait_connect_wallet_task())
         self.task_storage.add(task)
 
         reply_markup = self.__inline_keyboard.connect_wallet(
             wallets, app_wallet, universal_url,
             wallet_name=app_wallet.name,
         )
-        text = self.__text_message.get("connect_wallet").format(
-            wallet_name=app_wallet.name
-        )
-        await self._send_connect_wallet_window(text, reply_markup, universal_url, app_wallet)
-        await self.state.set_state(TcState.connect_wallet)
+        text = self.__text_message.get_formatted("connect_wallet", wallet_name=app_wallet.name)
+        sent = await self._send_connect_wallet_window(text, reply_markup, universal_url, app_wallet)
+        await self._flush_state_data()
+        if sent:
+            await self.state.set_state(TcState.connect_wallet)
 
     async def retry_connect_wallet(self) -> None:
         """
@@ -227,7 +430,7 @@ class ATCManager:
             reply_markup: InlineKeyboardMarkup,
             universal_url: str,
             app_wallet: WalletApp,
-    ) -> None:
+    ) -> bool:
         """
         Send the connect wallet window with appropriate content based on the qrcode_type.
 
@@ -235,32 +438,39 @@ class ATCManager:
         :param reply_markup: The inline keyboard markup for the message.
         :param universal_url: The universal URL for connecting the wallet.
         :param app_wallet: The AppWallet instance representing the connected wallet.
+        :return: False if the window was superseded by a newer message, True otherwise.
         """
         if isinstance(self.__qrcode_provider, QRImageProviderBase):
             photo = await self.__qrcode_provider.create_connect_wallet_image(
                 universal_url, app_wallet.image
             )
-            await self._send_photo(
+            message = await self._send_photo(
                 photo=BufferedInputFile(photo, "qr.png"),
                 caption=text,
                 reply_markup=reply_markup,
             )
-        else:
-            qrcode_url = await self.__qrcode_provider.create_connect_wallet_image_url(
-                universal_url, app_wallet.image
-            )
-            await self._send_message(
-                text=hide_link(qrcode_url) + text,
-                reply_markup=reply_markup,
-            )
+            return message is not False
+
+        qrcode_url = await self.__qrcode_provider.create_connect_wallet_image_url(
+            universal_url, app_wallet.image
+        )
+        message = await self._send_message(
+            text=f"{hide_link(qrcode_url)}{text}",
+            reply_markup=reply_markup,
+        )
+        return message is not False
 
     async def disconnect_wallet(self) -> None:
         """
         Disconnect the connected wallet.
+
+        If no wallet is connected, the disconnect request is not sent.
         """
-        await self.tonconnect.init_connector(self.user.id)
+        connector = await self.init_connector()
+        if not connector.connected:
+            return
         with suppress(WalletNotConnectedError):
-            await self.connector.disconnect_wallet()
+            await connector.disconnect_wallet()
 
     async def send_transaction(
             self,
@@ -273,42 +483,50 @@ class ATCManager:
         :param callbacks: Callbacks to execute.
         :param transaction: The transaction details.
         """
-        await self.tonconnect.init_connector(self.user.id)
+        await self.init_connector()
 
         self.connector._prepare_transaction(transaction)  # noqa
         self.connector._verify_send_transaction_feature(len(transaction.messages))  # noqa
 
-        await self.state.update_data(transaction=transaction.to_dict())
+        # Written together with the message ID of the window
+        self._stage_state_data(transaction=transaction.to_dict())
         await self.send_transaction_callbacks.add(callbacks)
 
-        task = asyncio.create_task(self.__wait_send_transaction_task())
+        task = create_background_task(self.__wait_send_transaction_task(transaction))
         self.task_storage.add(task)
 
-        text = self.__text_message.get("send_transaction").format(
-            wallet_name=self.connector.wallet_app.name,  # type: ignore
-        )
+        wallet_app: WalletApp = self.connector.wallet_app  # type: ignore
+        text = self.__text_message.get_formatted("send_transaction", wallet_name=wallet_app.name)
+        reply_markup = self.__inline_keyboard.send_transaction(wallet_app.name, get_direct_url(wallet_app))
 
-        reply_markup = self.__inline_keyboard.send_transaction(
-            self.connector.wallet_app.name, self.connector.wallet_app.direct_url,  # type: ignore
-        )
+        sent = await self._send_message(text=text, reply_markup=reply_markup)
+        await self._flush_state_data()
+        if sent is not False:
+            await self.state.set_state(TcState.send_transaction)
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.send_transaction)
+    def cancel_last_send_transaction(self) -> None:
+        """
+        Cancel the last pending transaction request of the user, if any.
+
+        The request ID is kept in the process memory, as pending requests live in the process connector.
+        """
+        last_rpc_request_id = self.task_storage.get_rpc_request_id()
+        if last_rpc_request_id is not None:
+            self.connector.cancel_pending_transaction(last_rpc_request_id)
 
     async def retry_last_send_transaction(self) -> None:
-        data = await self.state.get_data()
-        last_rpc_request_id = data.get("rpc_request_id", 0)
-        self.connector.cancel_pending_transaction(last_rpc_request_id)
+        data = await self.get_state_data()
+        self.cancel_last_send_transaction()
 
-        try:
-            transaction = Transaction.from_dict(data.get("transaction"))  # type: ignore
-            transaction.valid_until = int(time.time() + 5 * 60)
-        except KeyError:
+        if data.get("transaction") is None:
             raise RetrySendTransactionError(
                 "Last transaction not found. "
                 "You need to send a transaction first."
             )
 
+        transaction = Transaction.from_dict(data["transaction"])
+        transaction.valid_until = int(time.time() + 5 * 60)
+
         callbacks = await self.send_transaction_callbacks.get()
 
         if callbacks is None:
@@ -326,8 +544,8 @@ class ATCManager:
         text = self.__text_message.get("connect_wallet_proof_wrong")
         reply_markup = self.__inline_keyboard.connect_wallet_proof_wrong()
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.connect_wallet_proof_wrong)
+        if await self._send_message(text=text, reply_markup=reply_markup) is not False:
+            await self.state.set_state(TcState.connect_wallet_proof_wrong)
 
     async def _connect_wallet_reject(self) -> None:
         """
@@ -336,8 +554,8 @@ class ATCManager:
         text = self.__text_message.get("connect_wallet_rejected")
         reply_markup = self.__inline_keyboard.connect_wallet_rejected()
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.connect_wallet_rejected)
+        if await self._send_message(text=text, reply_markup=reply_markup) is not False:
+            await self.state.set_state(TcState.connect_wallet_rejected)
 
     async def _connect_wallet_timeout(self) -> None:
         """
@@ -346,8 +564,8 @@ class ATCManager:
         text = self.__text_message.get("connect_wallet_timeout")
         reply_markup = self.__inline_keyboard.connect_wallet_timeout()
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.connect_wallet_timeout)
+        if await self._send_message(text=text, reply_markup=reply_markup) is not False:
+            await self.state.set_state(TcState.connect_wallet_timeout)
 
     async def _send_transaction_timeout(self) -> None:
         """
@@ -356,8 +574,8 @@ class ATCManager:
         text = self.__text_message.get("send_transaction_timeout")
         reply_markup = self.__inline_keyboard.send_transaction_timeout()
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.send_transaction_timeout)
+        if await self._send_message(text=text, reply_markup=reply_markup) is not False:
+            await self.state.set_state(TcState.send_transaction_timeout)
 
     async def _send_transaction_rejected(self) -> None:
         """
@@ -366,32 +584,55 @@ class ATCManager:
         text = self.__text_message.get("send_transaction_rejected")
         reply_markup = self.__inline_keyboard.send_transaction_rejected()
 
-        await self._send_message(text=text, reply_markup=reply_markup)
-        await self.state.set_state(TcState.send_transaction_rejected)
+        if await self._send_message(text=text, reply_markup=reply_markup) is not False:
+            await self.state.set_state(TcState.send_transaction_rejected)
 
     async def _send_photo(
             self,
             photo: Any,
             caption: Optional[str] = None,
             reply_markup: Optional[InlineKeyboardMarkup] = None,
-    ) -> Message:
+    ) -> Union[Message, bool]:
         """
         Send a photo to the user.
 
+        The photo is sent in turn with the other message updates of the user, see _send_message.
+
         :param photo: The photo to send.
         :param caption: The caption for the photo.
         :param reply_markup: Optional InlineKeyboardMarkup for the message.
-        :return: Sent Message object.
+        :return: Sent Message object, or False if the update was superseded by a newer one.
         :raises TelegramBadRequest: If there is an issue with sending the photo.
         """
-        message = await self.bot.send_photo(
+        return await self.__send_latest(lambda: self.__send_photo(photo, caption, reply_markup))
+
+    async def __send_photo(
+            self,
+            photo: Any,
+            caption: Optional[str] = None,
+            reply_markup: Optional[InlineKeyboardMarkup] = None,
+    ) -> Message:
+        """
+        Send a photo in place of the previous message.
+
+        :param photo: The photo to send.
+        :param caption: The caption for the photo.
+        :param reply_markup: Optional InlineKeyboardMarkup for the message.
+        :return: Sent Message object.
+        """
+        message = await _retry_after(
+            self.bot.send_photo,
             chat_id=self.user.id,
             photo=photo,
             caption=caption,
             reply_markup=reply_markup,
         )
         await self._delete_previous_message()
-        await self.state.update_data(message_id=message.message_id)
+        await self.update_state_data(
+            message_id=message.message_id,
+            photo_message_id=message.message_id,
+            message_signature=None,
+        )
         return message
 
     async def _send_message(
@@ -404,33 +645,100 @@ class ATCManager:
 
         This method attempts to edit the existing message identified by the stored message ID. If editing is not
         possible (e.g., due to a message not found error), it sends a new message and deletes the previous one.
+        A photo message cannot be edited into a text message, so in that case the edit is not attempted.
 
         :param text: The text content of the message.
         :param reply_markup: Optional InlineKeyboardMarkup for the message.
-        :return: The edited or sent Message object.
+        :return: The edited or sent Message object, or False if the update was superseded by a newer one.
         :raises TelegramBadRequest: If there is an issue with sending or editing the message.
         """
-        state_data = await self.state.get_data()
+        return await self.__send_latest(lambda: self.__send_message(text, reply_markup))
+
+    async def __send_latest(self, send: Callable[[], Awaitable[T]]) -> Union[T, bool]:
+        """
+        Run a message update of the user once the previous updates are done.
+
+        Updates of the same user are sent one at a time. When several updates are waiting, only the latest one
+        is sent, so bursts of window changes result in a single request instead of hitting the rate limit.
+        A superseded window is never shown, so its FSM state must not be set either.
+
+        :param send: Coroutine function sending the update.
+        :return: The result of the update, or False if it was superseded by a newer one.
+        """
+        user_id = self.user.id
+        token = PENDING_MESSAGES[user_id] = object()
+
+        lock = MESSAGE_LOCKS.get(user_id)
+        if lock is None:
+            lock = MESSAGE_LOCKS[user_id] = asyncio.Lock()
+
+        waited = lock.locked()
+        async with lock:
+            if PENDING_MESSAGES.get(user_id) is not token:
+                return False
+            if waited:
+                # The previous update may have replaced the message
+                self._state_data = None
+            try:
+                return await send()
+            finally:
+                if PENDING_MESSAGES.get(user_id) is token:
+                    del PENDING_MESSAGES[user_id]
+
+    async def __send_message(
+            self,
+            text: str,
+            reply_markup: Optional[InlineKeyboardMarkup] = None,
+    ) -> Union[Message, bool]:
+        """
+        Edit the previous message or send a new one in its place.
+
+        If the previous message already shows the same text and keyboard, no request is made.
+        The signature is stored with the ID of the message it was rendered for, so a message
+        replaced outside the manager is never taken as unchanged.
+
+        :param text: The text content of the message.
+        :param reply_markup: Optional InlineKeyboardMarkup for the message.
+        :return: The edited or sent Message object, or True if the message is unchanged.
+        """
+        state_data = await self.get_state_data()
         message_id = state_data.get("message_id", None)
+        message: Optional[Union[Message, bool]] = None
 
-        try:
-            message = await self.bot.edit_message_text(
-                text=text,
-                chat_id=self.user.id,
-                message_id=message_id,
-                reply_markup=reply_markup,
-            )
-        except TelegramBadRequest as ex:
-            if not any(e in ex.message for e in MESSAGE_EDIT_ERRORS):
-                raise ex
-            message = await self.bot.send_message(
+        signature = hashlib.sha1(
+            f"{text}{reply_markup.model_dump_json() if reply_markup else ''}".encode()
+        ).hexdigest()
+        if message_id is not None and state_data.get("message_signature") == f"{message_id}:{signature}":
+            return True
+
+        # The photo flag is stored as the ID of the photo, so a message replaced outside the manager is edited
+        if message_id is None or state_data.get("photo_message_id") != message_id:
+            try:
+                message = await _retry_after(
+                    self.bot.edit_message_text,
+                    text=text,
+                    chat_id=self.user.id,
+                    message_id=message_id,
+                    reply_markup=reply_markup,
+                )
+            except TelegramBadRequest as ex:
+                if not MESSAGE_EDIT_ERRORS_RE.search(ex.message):
+                    raise ex
+
+        if message is None:
+            message = await _retry_after(
+                self.bot.send_message,
                 text=text,
                 chat_id=self.state.key.chat_id,
                 reply_markup=reply_markup,
             )
+            # The previous message is deleted only once the new one is shown
             await self._delete_previous_message()
         if isinstance(message, Message):
-            await self.state.update_data(message_id=message.message_id)
+            await self.update_state_data(
+                message_id=message.message_id,
+                message_signature=f"{message.message_id}:{signature}",
+            )
 
         return message
 
@@ -439,32 +747,35 @@ class ATCManager:
         Delete the previous message.
 
         This method attempts to delete the previous message identified by the stored message ID. If deletion is not
-        possible (e.g., due to a message not found error), it attempts to edit the previous message with a placeholder
-        emoji. If editing is also not possible, it raises TelegramBadRequest with the appropriate error message.
+        possible (e.g., the message is too old), it attempts to edit the previous message with a placeholder emoji.
+        A message that is not found is left as is.
 
         :return: The edited Message object or None if no previous message was found.
         :raises TelegramBadRequest: If there is an issue with deleting or editing the previous message.
         """
-        state_data = await self.state.get_data()
+        state_data = await self.get_state_data()
         message_id = state_data.get("message_id")
 
         if message_id is not None:
             try:
-                await self.bot.delete_message(
+                await _retry_after(
+                    self.bot.delete_message,
                     message_id=message_id,
                     chat_id=self.user.id,
                 )
             except TelegramBadRequest as ex:
-                if any(e in ex.message for e in MESSAGE_DELETE_ERRORS):
+                # A message that no longer exists does not need to be marked as outdated
+                if MESSAGE_DELETE_ERRORS_RE.search(ex.message) and MESSAGE_DELETE_NOT_FOUND_ERROR not in ex.message:
                     try:
                         text = self.__text_message.get("outdated_text")
-                        return await self.bot.edit_message_text(
+                        return await _retry_after(
+                            self.bot.edit_message_text,
                             message_id=message_id,
                             chat_id=self.user.id,
                             text=text,
                         )
                     except TelegramBadRequest as ex:
-                        if not any(e in ex.message for e in MESSAGE_EDIT_ERRORS):
+                        if not MESSAGE_EDIT_ERRORS_RE.search(ex.message):
                             raise ex
         return None
 
@@ -472,34 +783,40 @@ class ATCManager:
         """
         Wait for the connect wallet task.
 
-        This method checks the AiogramTonConnect connection status periodically for up to 3 minutes (360 iterations).
-        If the connection is restored, it updates the account wallet details, executes the appropriate callbacks,
-        and removes the task from the task storage. If the connection is not restored within the timeout, it
-        triggers the connect wallet timeout handling.
+        This method awaits the connection result without polling: the connector resolves a future when the
+        bridge delivers the wallet response, or with a timeout error when the connection request expires.
+        If the wallet is connected, it updates the account wallet details and executes the appropriate callbacks.
+        If the connection is rejected or not established within the timeout, it triggers the corresponding handling.
 
         :raises asyncio.CancelledError: If the task is cancelled.
-        :raises Exception: Any unexpected exception during the process.
         """
         try:
             async with self.connector.connect_wallet_context() as result:
+                # The state may have changed while waiting for the wallet
+                self._state_data = None
                 if isinstance(result, WalletInfo):
-                    state_data = await self.state.get_data()
-                    info_wallet = InfoWallet(**self.connector.wallet.to_dict())  # type: ignore
-                    account_wallet = AccountWallet.from_dict(self.connector.account.to_dict())  # type: ignore
+                    # Serialized before the reads, so the write follows them without a gap
+                    info_wallet = InfoWallet(**self.connector.wallet.to_dict()).to_dict()  # type: ignore
+                    account_wallet = AccountWallet.from_account(self.connector.account).to_dict()  # type: ignore
 
-                    await self.state.update_data(
-                        info_wallet=info_wallet.to_dict(),
-                        account_wallet=account_wallet.to_dict(),
+                    state_data, callbacks = await asyncio.gather(
+                        self.get_state_data(),
+                        self.connect_wallet_callbacks.get(),
                     )
+                    await self.update_state_data(info_wallet=info_wallet, account_wallet=account_wallet)
 
                     if state_data.get("check_proof", False):
                         proof_payload = state_data.get("proof_payload")
-                        if not self.connector.wallet.verify_proof(proof_payload):  # type: ignore
+                        # Signature verification is CPU-bound, so it runs outside the event loop
+                        verified = await asyncio.to_thread(
+                            self.connector.wallet.verify_proof, proof_payload,  # type: ignore
+                        )
+                        if not verified:
                             await self._connect_wallet_proof_wrong()
                             return
 
-                    self.middleware_data["connector"] = self.connector
-                    await self.execute_connect_wallet_after_callback()
+                    self.__data["connector"] = self.connector
+                    await self.__execute_callback(self.connect_wallet_callbacks, "after_callback", callbacks)
 
                 elif isinstance(result, RequestTimeoutError):
                     await self._connect_wallet_timeout()
@@ -509,41 +826,36 @@ class ATCManager:
 
         except asyncio.CancelledError:
             pass
-        except Exception:
-            raise
-        finally:
-            self.task_storage.remove()
 
-    async def __wait_send_transaction_task(self) -> None:
+    async def __wait_send_transaction_task(self, transaction: Transaction) -> None:
         """
         Wait for the send transaction task.
 
         This method waits for the Tonconnect to send a transaction within a timeout of 5 minutes. If the transaction
-        is sent successfully, it updates the user's last transaction details, executes the appropriate callbacks, and
-        removes the task from the task storage. If the user rejects the transaction, it triggers the send transaction
-        rejection handling. If the transaction is not sent within the timeout, it triggers the send transaction
-        timeout handling.
+        is sent successfully, it updates the user's last transaction details and executes the appropriate callbacks.
+        If the user rejects the transaction, it triggers the send transaction rejection handling. If the transaction
+        is not sent within the timeout, it triggers the send transaction timeout handling.
 
+        :param transaction: The transaction to send.
         :raises UserRejectsError: If the user rejects the transaction.
         :raises asyncio.TimeoutError: If the transaction is not sent within the timeout.
         :raises asyncio.CancelledError: If the task is cancelled.
-        :raises Exception: Any unexpected exception during the process.
         """
+        rpc_request_id = None
         try:
-            data = await self.state.get_data()
-            last_rpc_request_id = data.get("rpc_request_id", 0)
-            self.connector.cancel_pending_transaction(last_rpc_request_id)
+            self.cancel_last_send_transaction()
 
-            transaction = Transaction.from_dict(data.get("transaction"))  # type: ignore
             rpc_request_id = await self.connector.send_transaction(transaction)
-            await self.state.update_data(rpc_request_id=rpc_request_id)
+            self.task_storage.set_rpc_request_id(rpc_request_id)
 
             async with self.connector.pending_transaction_context(rpc_request_id) as result:
+                # The state may have changed while waiting for the transaction
+                self._state_data = None
                 if isinstance(result, SendTransactionResponse):
                     last_transaction_boc = result.boc
                     self.__data["boc"] = last_transaction_boc
                     self.user.last_transaction_boc = last_transaction_boc
-                    await self.state.update_data(last_transaction_boc=last_transaction_boc)
+                    await self.update_state_data(last_transaction_boc=last_transaction_boc)
                     await self.execute_transaction_after_callback()
 
                 elif isinstance(result, RequestTimeoutError):
@@ -560,7 +872,7 @@ class ATCManager:
 
         except asyncio.CancelledError:
             pass
-        except Exception:
-            raise
         finally:
-            self.task_storage.remove()
+            # The request is no longer awaited, so its ID is not kept for cancellation
+            if rpc_request_id is not None:
+                self.task_storage.remove_rpc_request_id(rpc_request_id)
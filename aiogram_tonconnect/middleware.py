@@ -1,4 +1,5 @@
-from typing import Callable, Dict, Any, Awaitable, Optional, Type, Union
+import asyncio
+from typing import Callable, Dict, Any, Awaitable, Optional, Tuple, Type, Union
 
 from aiogram import BaseMiddleware
 from aiogram.fsm.context import FSMContext
@@ -33,6 +34,7 @@ class AiogramTonConnectMiddleware(BaseMiddleware):
         self.qrcode_provider = qrcode_provider or QRImageProvider()
         self.text_message = text_message or TextMessage
         self.inline_keyboard = inline_keyboard or InlineKeyboard
+        self._interfaces: Dict[Optional[str], Tuple[TextMessageBase, InlineKeyboardBase]] = {}
 
     async def __call__(
             self,
@@ -51,10 +53,11 @@ class AiogramTonConnectMiddleware(BaseMiddleware):
         user: Optional[User] = data.get("event_from_user")
         chat: Optional[Chat] = data.get("event_chat")
 
-        if self._is_private_chat_with_user(chat, user):
-            if user and chat:
-                await self._setup_user_context(user, data)
+        # Other events skip the state and connector round-trips entirely
+        if not self._is_private_chat_with_user(chat, user):
+            return await handler(event, data)
 
+        await self._setup_user_context(user, data)  # type: ignore
         return await handler(event, data)
 
     @staticmethod
@@ -76,9 +79,11 @@ class AiogramTonConnectMiddleware(BaseMiddleware):
         :param data: Contextual data dictionary.
         """
         state: Optional[FSMContext] = data.get("state")
-        state_data = await state.get_data() if state else {}
-
-        connector = await self._get_connector(user.id)
+        if state is not None:
+            # The state data and the connector are independent, so they are read concurrently
+            state_data, connector = await asyncio.gather(state.get_data(), self._get_connector(user.id))
+        else:
+            state_data, connector = {}, await self._get_connector(user.id)
         data["connector"] = connector
 
         language_code = state_data.get("language_code", user.language_code)
@@ -92,17 +97,36 @@ class AiogramTonConnectMiddleware(BaseMiddleware):
         )
         data["atc_user"] = atc_user
 
+        text_message, inline_keyboard = self._get_interfaces(language_code)
         atc_manager = ATCManager(
             connector=connector,
             tonconnect=self.tonconnect,
-            text_message=self.text_message(language_code),
-            inline_keyboard=self.inline_keyboard(language_code),
+            text_message=text_message,
+            inline_keyboard=inline_keyboard,
             qrcode_provider=self.qrcode_provider,
             user=atc_user,
             data=data,
         )
         data["atc_manager"] = atc_manager
 
+    def _get_interfaces(self, language_code: Optional[str]) -> Tuple[TextMessageBase, InlineKeyboardBase]:
+        """
+        Get the text message and inline keyboard instances for the language.
+
+        The instances are created once per language and shared by all users,
+        so the manager switches the language by rebinding them instead of mutating.
+
+        :param language_code: The language code of the user.
+        :return: Tuple of the text message and inline keyboard instances.
+        """
+        interfaces = self._interfaces.get(language_code)
+        if interfaces is None:
+            interfaces = self._interfaces[language_code] = (
+                self.text_message(language_code),  # type: ignore
+                self.inline_keyboard(language_code),  # type: ignore
+            )
+        return interfaces
+
     async def _get_connector(self, user_id: int) -> Any:
         """
         Initialize or retrieve a TonConnect connector.
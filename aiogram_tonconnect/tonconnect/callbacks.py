@@ -1,11 +1,16 @@
 import pickle
 
+from cachetools import TTLCache
 from tonutils.tonconnect import IStorage
 
 from aiogram_tonconnect.tonconnect.models import ConnectWalletCallbacks, SendTransactionCallbacks
 
+# Initialize cache for storing the deserialized callbacks of each user for 1 minute
+CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 class ConnectWalletCallbackStorage:
+    __slots__ = ("storage", "user_id", "collection", "_key")
 
     def __init__(
             self,
@@ -16,28 +21,33 @@ class ConnectWalletCallbackStorage:
         self.storage = storage
         self.user_id = user_id
         self.collection = collection
-
-    def _get_key(self) -> str:
-        """
-        Generate a unique key for the session storage.
-
-        :return: Unique key combining the collection and user_id.
-        """
-        return f"{self.collection}:{self.user_id}"
+        # Unique key combining the collection and user_id
+        self._key = f"{collection}:{user_id}"
 
     async def get(self) -> ConnectWalletCallbacks:
-        value = await self.storage.get_item(self._get_key())
-        return ConnectWalletCallbacks(**pickle.loads(value)) if value else None  # type: ignore
+        key = self._key
+        callbacks = CACHE.get(key)
+        if callbacks is None:
+            value = await self.storage.get_item(key)
+            if not value:
+                return None  # type: ignore
+            callbacks = CACHE[key] = ConnectWalletCallbacks(**pickle.loads(value))  # type: ignore
+        return callbacks
 
     async def add(self, connect_wallet_callbacks: ConnectWalletCallbacks) -> None:
+        key = self._key
         serialized_value = pickle.dumps(connect_wallet_callbacks.to_dict())
-        await self.storage.set_item(self._get_key(), serialized_value)  # type: ignore
+        CACHE[key] = connect_wallet_callbacks
+        await self.storage.set_item(key, serialized_value)  # type: ignore
 
     async def remove(self) -> None:
-        await self.storage.remove_item(self._get_key())
+        key = self._key
+        CACHE.pop(key, None)
+        await self.storage.remove_item(key)
 
 
 class SendTransactionCallbackStorage:
+    __slots__ = ("storage", "user_id", "collection", "_key")
 
     def __init__(
             self,
@@ -48,22 +58,26 @@ class SendTransactionCallbackStorage:
         self.storage = storage
         self.user_id = user_id
         self.collection = collection
-
-    def _get_key(self) -> str:
-        """
-        Generate a unique key for the session storage.
-
-        :return: Unique key combining the collection and user_id.
-        """
-        return f"{self.collection}:{self.user_id}"
+        # Unique key combining the collection and user_id
+        self._key = f"{collection}:{user_id}"
 
     async def get(self) -> SendTransactionCallbacks:
-        value = await self.storage.get_item(self._get_key())
-        return SendTransactionCallbacks(**pickle.loads(value)) if value else None  # type: ignore
+        key = self._key
+        callbacks = CACHE.get(key)
+        if callbacks is None:
+            value = await self.storage.get_item(key)
+            if not value:
+                return None  # type: ignore
+            callbacks = CACHE[key] = SendTransactionCallbacks(**pickle.loads(value))  # type: ignore
+        return callbacks
 
     async def add(self, send_transaction_callbacks: SendTransactionCallbacks) -> None:
+        key = self._key
         serialized_value = pickle.dumps(send_transaction_callbacks.to_dict())
-        await self.storage.set_item(self._get_key(), serialized_value)  # type: ignore
+        CACHE[key] = send_transaction_callbacks
+        await self.storage.set_item(key, serialized_value)  # type: ignore
 
     async def remove(self) -> None:
-        await self.storage.remove_item(self._get_key())
+        key = self._key
+        CACHE.pop(key, None)
+        await self.storage.remove_item(key)
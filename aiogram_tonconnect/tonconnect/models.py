@@ -54,6 +54,21 @@ class ATCUser:
 @dataclass
 class AccountWallet(Account):
 
+    @classmethod
+    def from_account(cls, account: Account) -> "AccountWallet":
+        """
+        Create an AccountWallet from an already parsed Account without re-parsing its address.
+
+        :param account: The Account instance.
+        :return: An AccountWallet instance.
+        """
+        return cls(
+            address=account.address,
+            chain=account.chain,
+            wallet_state_init=account.wallet_state_init,
+            public_key=account.public_key,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "address": self.address.to_str(is_bounceable=False),
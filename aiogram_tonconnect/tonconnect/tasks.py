@@ -1,7 +1,26 @@
+import asyncio
 from asyncio import Task
-from typing import Dict, Optional
+from typing import Any, Coroutine, Dict, Optional, Set
 
 TASKS: Dict[int, Task] = {}
+RPC_REQUEST_IDS: Dict[int, int] = {}
+BACKGROUND_TASKS: Set[Task] = set()
+
+
+def create_background_task(coro: Coroutine[Any, Any, Any]) -> Task:
+    """
+    Create a fire-and-forget task.
+
+    The event loop keeps only weak references to tasks, so a strong reference is kept
+    until the task is done to prevent it from being garbage collected mid-flight.
+
+    :param coro: Coroutine to run.
+    :return: The created task.
+    """
+    task = asyncio.create_task(coro)
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(BACKGROUND_TASKS.discard)
+    return task
 
 
 class TaskStorage:
@@ -17,12 +36,23 @@ class TaskStorage:
         Add a task to the storage.
 
         If a task already exists for the user, it is removed before adding the new task.
+        The task is dropped from the storage once it is done, unless it has already been replaced.
 
         :param task: Task to be added.
         """
         if self.user_id in TASKS:
             self.remove()
         TASKS[self.user_id] = task
+        task.add_done_callback(self.__discard)
+
+    def __discard(self, task: Task) -> None:
+        """
+        Drop the done task from the storage if it is still the task of the user.
+
+        :param task: The done task.
+        """
+        if TASKS.get(self.user_id) is task:
+            del TASKS[self.user_id]
 
     def get(self) -> Optional[Task]:
         """
@@ -42,3 +72,28 @@ class TaskStorage:
         if task and not task.done():
             task.cancel()
         TASKS.pop(self.user_id, None)
+
+    def set_rpc_request_id(self, rpc_request_id: int) -> None:
+        """
+        Set the ID of the last transaction request sent by the user.
+
+        :param rpc_request_id: ID of the transaction request.
+        """
+        RPC_REQUEST_IDS[self.user_id] = rpc_request_id
+
+    def get_rpc_request_id(self) -> Optional[int]:
+        """
+        Get the ID of the last transaction request sent by the user.
+
+        :return: ID of the transaction request, or None if not found.
+        """
+        return RPC_REQUEST_IDS.get(self.user_id)
+
+    def remove_rpc_request_id(self, rpc_request_id: int) -> None:
+        """
+        Remove the ID of the last transaction request sent by the user, unless a newer one replaced it.
+
+        :param rpc_request_id: ID of the finished transaction request.
+        """
+        if RPC_REQUEST_IDS.get(self.user_id) == rpc_request_id:
+            del RPC_REQUEST_IDS[self.user_id]
@@ -0,0 +1,88 @@
+import asyncio
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
+from tonutils.tonconnect import TonConnect
+from tonutils.tonconnect.models import WalletApp
+
+# Period for which the wallets list of a TonConnect instance is reused, 5 minutes.
+# tonutils caches the raw list, but filters it and rebuilds every WalletApp on each call,
+# so the built list is kept briefly to keep new wallets from being delayed much longer
+CACHE_TTL = 300
+# Initialize cache for storing the expiry time, the wallets list and the wallets mapping of each TonConnect instance
+CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Locks guarding the wallets list fetch of each TonConnect instance
+LOCKS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Initialize cache for storing the direct URLs of wallets by their universal URL for 1 hour
+DIRECT_URLS: TTLCache = TTLCache(maxsize=100, ttl=3600)
+
+
+async def _get_cached_wallets(tonconnect: TonConnect) -> Tuple[List[WalletApp], Dict[str, WalletApp]]:
+    """
+    Get the wallets list and the wallets mapping by app name from the cache.
+
+    The wallets list is fetched once per cache period and shared by all users of the process.
+
+    :param tonconnect: TonConnect instance.
+    :return: Tuple of the wallets list and the wallets mapping by app name.
+    """
+    cached = CACHE.get(tonconnect)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+
+    lock = LOCKS.get(tonconnect)
+    if lock is None:
+        lock = LOCKS[tonconnect] = asyncio.Lock()
+
+    async with lock:
+        # Another coroutine may have filled the cache while we were waiting
+        cached = CACHE.get(tonconnect)
+        if cached is None or cached[0] <= time.monotonic():
+            wallets = await tonconnect.get_wallets()
+            cached = CACHE[tonconnect] = (
+                time.monotonic() + CACHE_TTL,
+                wallets,
+                {wallet.app_name: wallet for wallet in wallets},
+            )
+        return cached[1], cached[2]
+
+
+async def get_wallets(tonconnect: TonConnect) -> List[WalletApp]:
+    """
+    Get the cached list of available wallets.
+
+    :param tonconnect: TonConnect instance.
+    :return: List of available app wallets.
+    """
+    wallets, _ = await _get_cached_wallets(tonconnect)
+    return wallets
+
+
+async def get_wallet(tonconnect: TonConnect, app_name: str) -> WalletApp:
+    """
+    Get a cached wallet by app name.
+
+    :param tonconnect: TonConnect instance.
+    :param app_name: App name of the wallet.
+    :return: The wallet with the given app name, or the first available wallet if not found.
+    """
+    wallets, wallets_map = await _get_cached_wallets(tonconnect)
+    return wallets_map.get(app_name, wallets[0])
+
+
+def get_direct_url(wallet: WalletApp) -> Optional[str]:
+    """
+    Get the cached direct URL of a wallet.
+
+    The direct URL is derived from the universal URL by parsing and rebuilding it,
+    so it is computed once per universal URL.
+
+    :param wallet: The app wallet.
+    :return: The direct URL of the wallet, or None if the wallet has no universal URL.
+    """
+    key = wallet.universal_url
+    if key not in DIRECT_URLS:
+        DIRECT_URLS[key] = wallet.direct_url
+    return DIRECT_URLS[key]
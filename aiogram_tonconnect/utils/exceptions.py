@@ -1,3 +1,6 @@
+import re
+
+
 class AiogramTonconnectException(Exception):
     """
     Base exception class for Aiogram AiogramTonConnect custom exceptions.
@@ -30,8 +33,15 @@ MESSAGE_EDIT_ERRORS = [
     "message to edit not found",
 ]
 
+# Error message of deleting a message that no longer exists
+MESSAGE_DELETE_NOT_FOUND_ERROR = "message to delete not found"
+
 # List of error messages related to deleting messages
 MESSAGE_DELETE_ERRORS = [
     "message can't be deleted",
-    "message to delete not found",
+    MESSAGE_DELETE_NOT_FOUND_ERROR,
 ]
+
+# Precompiled patterns matching any of the errors related to editing and deleting messages
+MESSAGE_EDIT_ERRORS_RE = re.compile("|".join(map(re.escape, MESSAGE_EDIT_ERRORS)))
+MESSAGE_DELETE_ERRORS_RE = re.compile("|".join(map(re.escape, MESSAGE_DELETE_ERRORS)))
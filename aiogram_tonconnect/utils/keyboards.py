@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from aiogram.utils.keyboard import InlineKeyboardButton as Button
 from aiogram.utils.keyboard import InlineKeyboardMarkup as Markup, InlineKeyboardBuilder
@@ -31,9 +31,28 @@ class InlineKeyboardBase(metaclass=ABCMeta):
 
         :param language_code: The language code for the button texts.
         """
-        if language_code not in self.texts_buttons.keys():
+        texts_buttons = self.texts_buttons
+        if language_code not in texts_buttons.keys():
             language_code = "en"
-        self.language_code = language_code
+        self._language_code = language_code
+        self._texts = texts_buttons[language_code]
+
+    @property
+    def language_code(self) -> str:
+        """
+        The language code of the button texts.
+        """
+        return self._language_code
+
+    @language_code.setter
+    def language_code(self, language_code: str) -> None:
+        """
+        Set the language code and bind the button texts of that language.
+
+        :param language_code: The language code for the button texts.
+        """
+        self._language_code = language_code
+        self._texts = self.texts_buttons[language_code]
 
     @abstractmethod
     def connect_wallet(
@@ -116,13 +135,15 @@ class InlineKeyboardBase(metaclass=ABCMeta):
         :param kwargs: Additional arguments for formatting button text.
         :return: Inline keyboard button.
         """
-        text = self.texts_buttons[self.language_code][code].format_map(kwargs)
+        text = self._texts[code].format_map(kwargs)
         if not url:
             return Button(text=text, callback_data=code)
         return Button(text=text, url=url)
 
 
 class InlineKeyboard(InlineKeyboardBase):
+    # The retry markup does not depend on the window, so it is built once per keyboard class and language
+    _retry_markups: Dict[Tuple[type, str], Markup] = {}
 
     @property
     def texts_buttons(self) -> Dict[str, Dict[str, str]]:
@@ -142,11 +163,15 @@ class InlineKeyboard(InlineKeyboardBase):
         }
 
     def _retry_markup(self) -> Markup:
-        inline_keyboard = [
-            [self._get_button("back"),
-             self._get_button("retry")],
-        ]
-        return Markup(inline_keyboard=inline_keyboard)
+        key = type(self), self.language_code
+        markup = self._retry_markups.get(key)
+        if markup is None:
+            inline_keyboard = [
+                [self._get_button("back"),
+                 self._get_button("retry")],
+            ]
+            markup = self._retry_markups[key] = Markup(inline_keyboard=inline_keyboard)
+        return markup
 
     def connect_wallet_proof_wrong(self) -> Markup:
         return self._retry_markup()
@@ -29,9 +29,28 @@ class TextMessageBase(metaclass=ABCMeta):
 
         :param language_code: The language code for the text messages.
         """
-        if language_code not in self.texts_messages.keys():
+        texts_messages = self.texts_messages
+        if language_code not in texts_messages.keys():
             language_code = "en"
-        self.language_code = language_code
+        self._language_code = language_code
+        self._texts = texts_messages[language_code]
+
+    @property
+    def language_code(self) -> str:
+        """
+        The language code of the text messages.
+        """
+        return self._language_code
+
+    @language_code.setter
+    def language_code(self, language_code: str) -> None:
+        """
+        Set the language code and bind the text messages of that language.
+
+        :param language_code: The language code for the text messages.
+        """
+        self._language_code = language_code
+        self._texts = self.texts_messages[language_code]
 
     def get(self, code: str) -> str:
         """
@@ -40,7 +59,17 @@ class TextMessageBase(metaclass=ABCMeta):
         :param code: Code identifying the specific message.
         :return: The text message.
         """
-        return self.texts_messages[self.language_code][code]
+        return self._texts[code]
+
+    def get_formatted(self, code: str, **kwargs) -> str:
+        """
+        Get a specific text message formatted with the given arguments.
+
+        :param code: Code identifying the specific message.
+        :param kwargs: Arguments for formatting the message.
+        :return: The formatted text message.
+        """
+        return self.get(code).format_map(kwargs)
 
 
 class TextMessage(TextMessageBase):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.fsm.storage.redis import RedisStorage
@@ -50,8 +51,12 @@ async def main():
     """
     config = Config.load()
 
-    # Initialize Redis storage for FSM
-    storage = RedisStorage.from_url(config.REDIS_DSN)
+    # Initialize Redis storage for FSM, serializing the state data with orjson
+    storage = RedisStorage.from_url(
+        config.REDIS_DSN,
+        json_loads=orjson.loads,
+        json_dumps=lambda data: orjson.dumps(data).decode(),
+    )
     bot = Bot(config.BOT_TOKEN, default=DefaultBotProperties(parse_mode="HTML"))
     dp = Dispatcher(storage=storage)
 